@@ -1,3 +1,3 @@
 @echo off
-python screenshot.py
+python screenshot.py screenshot.webp
 pause
\ No newline at end of file
@@ -1,9 +1,42 @@
+import os
+import sys
 import time
-from PIL import ImageGrab
+import hashlib
+from PIL import Image
 
-# every 1 min take a screenshot and save it to screenshot.png in current path
+try:
+	import mss  # much faster than PIL.ImageGrab
+except ImportError:
+	mss = None
+	from PIL import ImageGrab
+
+# Output file; the format follows the extension. Pass a path to override,
+# e.g. "python screenshot.py screenshot.png" for the old PNG output
+SCREENSHOT_FILE = sys.argv[1] if len(sys.argv) > 1 else "screenshot.webp"
+INTERVAL = 60  # seconds
+
+
+def grab():
+	"""Return (raw RGB bytes, size) of the primary screen"""
+	if mss is not None:
+		with mss.mss() as sct:
+			shot = sct.grab(sct.monitors[1])  # monitors[0] is the whole virtual desktop
+			return shot.rgb, shot.size
+	with ImageGrab.grab() as screenshot, screenshot.convert("RGB") as rgb:
+		return rgb.tobytes(), rgb.size
+
+
+print(f"Saving a screenshot to {SCREENSHOT_FILE} every {INTERVAL}s")
+
+# every 1 min take a screenshot and save it in current path,
+# skipping the encode when the screen hasn't changed since the last capture
+last_digest = None
 while True:
-	screenshot = ImageGrab.grab()
-	screenshot.save("screenshot.png")
-	screenshot.close()
-	time.sleep(60)
\ No newline at end of file
+	raw, size = grab()
+	digest = hashlib.md5(raw).digest()
+	# Rewrite if the file went missing (deleted/rotated) even when the screen is idle
+	if digest != last_digest or not os.path.exists(SCREENSHOT_FILE):
+		with Image.frombytes("RGB", size, raw) as screenshot:
+			screenshot.save(SCREENSHOT_FILE, quality=85)  # quality is ignored by lossless formats
+		last_digest = digest
+	time.sleep(INTERVAL)
@@ -7,13 +7,28 @@ Serves static files and WebSocket on the same port
 
 import serial
 import asyncio
+import importlib
 import json
+import logging
+import queue
+import socket
+import struct
 import sys
 import os
-from datetime import datetime
-from typing import Set
+import time
+import threading
+from collections import deque
+from typing import Dict
 from aiohttp import web
 import aiohttp_cors
+from logging.handlers import QueueHandler, QueueListener
+
+# orjson is optional; it is several times faster than the stdlib for small dicts
+try:
+    from orjson import dumps as encode_json  # Returns UTF-8 bytes
+except ImportError:
+    def encode_json(obj):
+        return json.dumps(obj).encode('utf-8')
 
 # Configuration
 SERIAL_PORT = 'COM4'  # Change this to your COM port
@@ -21,18 +36,95 @@ BAUD_RATE = 115200
 WEBSOCKET_HOST = 'localhost'
 WEBSOCKET_PORT = 3001
 RATE_LIMIT_MS = 300  # 300ms between commands
+RATE_LIMIT_NS = RATE_LIMIT_MS * 1_000_000
+SERIAL_RETRY_MIN = 0.01  # First retry delay (s) after a serial read error, doubled while errors persist
+SERIAL_RETRY_MAX = 1.0   # Cap for the serial read retry delay (s)
+LOG_LEVEL = logging.INFO  # DEBUG traces every serial/TUIO/command message (--debug or NEX_LOG_LEVEL=DEBUG)
 
 # TUIO Configuration
 TUIO_HOST = '0.0.0.0'  # Listen on all interfaces
 TUIO_PORT = 3333       # Standard TUIO port
+TUIO_FLUSH_MS = 16     # Max time to hold TUIO messages waiting for a frame boundary (fseq / /tuio2/alv)
+# UDP sockets sharing the TUIO port via SO_REUSEPORT; extra ones parse on worker threads.
+# Leave at 1 unless profiling shows the main loop saturated by many TUIO senders:
+# - Linux only; the kernel picks a socket by hashing the sender's address/port,
+#   so a single tracker always lands on the same shard (no gain for one source)
+# - macOS/Windows don't spread UDP across sockets, so shards are disabled there
+# - The GIL keeps OSC parsing on worker threads from running truly in parallel
+# - Every datagram a worker shard handles costs a wakeup on the main loop
+TUIO_SHARDS = 1
+
+log = logging.getLogger('nexmosphere')
+
+# Creates event loops for the main loop and TUIO shard threads (uvloop/winloop when available)
+event_loop_factory = asyncio.new_event_loop
 
-# Store connected clients
-connected_clients: Set = set()
+# WebSocketResponse.send_frame() (send pre-encoded text) needs aiohttp >= 3.11
+_HAS_SEND_FRAME = hasattr(web.WebSocketResponse, 'send_frame')
+
+# Store connected clients, each with its own outbound message queue
+connected_clients: Dict = {}
+_clients_snapshot: tuple = ()  # (ws, outbox) pairs, rebuilt only when membership changes
+_close_tasks = set()  # Pending close() tasks for dropped clients
+CLIENT_QUEUE_SIZE = 32  # Max pending messages per client lane; oldest TUIO frames are shed beyond this
 
 # Command queue for rate limiting
 command_queue = asyncio.Queue()
-last_command_time = 0.0
+next_command_ns = 0  # time.monotonic_ns() deadline before which no command may be sent
 is_processing_queue = False
+_CRLF = b'\r\n'  # Serial command terminator
+serial_stop = threading.Event()  # Tells the serial reader thread to exit
+
+# Cached message timestamp, reused for every call within the same millisecond
+_ts_last_ms = 0
+_ts_last_str = ''
+_ts_last_sec = 0
+_ts_sec_str = ''
+
+
+def _now_ts():
+    """Return the current local time as HH:MM:SS.mmm"""
+    global _ts_last_ms, _ts_last_str, _ts_last_sec, _ts_sec_str
+    ms = time.time_ns() // 1_000_000
+    if ms != _ts_last_ms:
+        sec, msec = divmod(ms, 1000)
+        if sec != _ts_last_sec:
+            _ts_sec_str = time.strftime('%H:%M:%S', time.localtime(sec))
+            _ts_last_sec = sec
+        _ts_last_str = f'{_ts_sec_str}.{msec:03d}'
+        _ts_last_ms = ms
+    return _ts_last_str
+
+
+def serial_read_thread(ser, loop, line_queue):
+    """
+    Block on the serial port in a background thread and hand each line to the event loop
+    Runs until serial_stop is set (shutdown) or the event loop is closed
+    """
+    retry_sleep = SERIAL_RETRY_MIN
+    while not serial_stop.is_set():
+        try:
+            line = ser.readline()  # Blocks until a newline arrives
+            retry_sleep = SERIAL_RETRY_MIN
+        except Exception as e:
+            if serial_stop.is_set():
+                return  # Port closed under us during shutdown
+            if not isinstance(e, serial.SerialException) or not ser.is_open:
+                # Closed port or unexpected failure: retrying can't help
+                log.error('[SERIAL-ERROR] Read error, serial reader stopped: %s', e)
+                return
+            # Retry quickly after a transient glitch, back off while it persists
+            if retry_sleep == SERIAL_RETRY_MIN:
+                log.error('[SERIAL-ERROR] Read error: %s', e)
+            time.sleep(retry_sleep)
+            retry_sleep = min(retry_sleep * 2, SERIAL_RETRY_MAX)
+            continue
+        
+        if line:
+            try:
+                loop.call_soon_threadsafe(line_queue.put_nowait, line)
+            except RuntimeError:
+                return  # Event loop closed
 
 
 async def serial_reader(ser):
@@ -40,52 +132,139 @@ async def serial_reader(ser):
     Read from serial port and broadcast to WebSocket clients
     """
     try:
-        print(f'[SERIAL] Connected to {ser.port} at {ser.baudrate} baud')
+        log.info('[SERIAL] Connected to %s at %s baud', ser.port, ser.baudrate)
+        
+        line_queue = asyncio.Queue()
+        threading.Thread(
+            target=serial_read_thread,
+            args=(ser, asyncio.get_running_loop(), line_queue),
+            name='serial-reader',
+            daemon=True
+        ).start()
         
         while True:
-            try:
-                if ser.in_waiting > 0:
-                    line = ser.readline().decode('utf-8', errors='ignore').strip()
-                    if line:
-                        timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-                        message = {
-                            'timestamp': timestamp,
-                            'data': line,
-                            'type': 'serial_data'
-                        }
-                        print(f'[SERIAL-IN] {timestamp} - "{line}"')
-                        
-                        # Broadcast to all connected WebSocket clients
-                        if connected_clients:
-                            disconnected = set()
-                            
-                            for client in connected_clients:
-                                try:
-                                    await client.send_json(message)
-                                    print(f'[WEBSOCKET-SEND] Broadcasting to {len(connected_clients)} client(s)')
-                                except Exception as e:
-                                    print(f'[WEBSOCKET-ERROR] Failed to send to client: {e}')
-                                    disconnected.add(client)
-                            
-                            # Remove disconnected clients
-                            connected_clients.difference_update(disconnected)
-                
-                await asyncio.sleep(0.01)  # Small delay to prevent CPU spinning
-                
-            except Exception as e:
-                print(f'[SERIAL-ERROR] Read error: {e}')
-                await asyncio.sleep(1)
+            raw = await line_queue.get()
+            line = raw.decode('utf-8', errors='ignore').strip()
+            if not line:
+                continue
+            
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug('[SERIAL-IN] %s - "%s"', _now_ts(), line)
+            
+            # Broadcast to all connected WebSocket clients
+            if connected_clients:
+                message = {
+                    'timestamp': _now_ts(),
+                    'data': line,
+                    'type': 'serial_data'
+                }
+                log.debug('[WEBSOCKET-SEND] Broadcasting to %d client(s)', len(connected_clients))
+                broadcast(message)
     
     except Exception as e:
-        print(f'[SERIAL-ERROR] Connection error: {e}')
-        print(f'[SERIAL] Available ports: {get_available_ports()}')
+        log.error('[SERIAL-ERROR] Connection error: %s', e)
+        log.info('[SERIAL] Available ports: %s', get_available_ports())
+
+
+class ClientOutbox:
+    """
+    Per-client outbound buffer with two lanes: serial data is never shed,
+    TUIO frames keep only the newest maxsize entries (oldest dropped first)
+    """
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.messages = deque()
+        self.frames = deque(maxlen=maxsize)
+        self.ready = asyncio.Event()
+    
+    def put(self, droppable, payload):
+        """
+        Queue a payload
+        Returns False if a must-keep message doesn't fit (client can't keep up)
+        """
+        if droppable:
+            # A full deque discards its oldest frame; each TUIO frame restates the
+            # alive set, so newer frames supersede older ones
+            self.frames.append(payload)
+        elif len(self.messages) < self.maxsize:
+            self.messages.append(payload)
+        else:
+            return False
+        self.ready.set()
+        return True
+    
+    async def get(self):
+        """Wait for and return the next payload, serial data first"""
+        while not self.messages and not self.frames:
+            self.ready.clear()
+            await self.ready.wait()
+        if self.messages:
+            return self.messages.popleft()
+        return self.frames.popleft()
+
+
+def add_client(ws, outbox):
+    """Register a WebSocket client and refresh the broadcast snapshot"""
+    global _clients_snapshot
+    connected_clients[ws] = outbox
+    _clients_snapshot = tuple(connected_clients.items())
+
+
+def remove_client(ws):
+    """Unregister a WebSocket client and refresh the broadcast snapshot"""
+    global _clients_snapshot
+    if connected_clients.pop(ws, None) is not None:
+        _clients_snapshot = tuple(connected_clients.items())
+
+
+def broadcast(message, droppable=False):
+    """
+    Queue a message for all connected WebSocket clients
+    Droppable messages (TUIO frames) may be shed for slow clients; others never are
+    """
+    # Serialize and encode once; each client's sender task drains its own queue
+    # so a slow client never stalls the producer or the other clients
+    payload = encode_json(message)
+    for client, outbox in _clients_snapshot:
+        if not outbox.put(droppable, payload):
+            # Backed up with messages we must not lose: client can't keep up
+            log.warning('[WEBSOCKET-ERROR] Client send queue full, dropping client')
+            remove_client(client)
+            # Keep a reference so the close task isn't garbage-collected mid-flight
+            task = asyncio.create_task(client.close())
+            _close_tasks.add(task)
+            task.add_done_callback(_close_tasks.discard)
+
+
+async def client_sender(ws, outbox):
+    """
+    Drain a client's outbox onto its WebSocket
+    """
+    try:
+        while True:
+            payload = await outbox.get()
+            if _HAS_SEND_FRAME:
+                # Send the pre-encoded UTF-8 as a text frame (no per-client re-encode)
+                await ws.send_frame(payload, web.WSMsgType.TEXT)
+            else:
+                await ws.send_str(payload.decode('utf-8'))
+    except asyncio.CancelledError:
+        pass
+    except Exception as e:
+        log.warning('[WEBSOCKET-ERROR] Failed to send to client: %s', e)
+        remove_client(ws)
+        # Close so the handler exits instead of leaving a connected client that gets nothing
+        try:
+            await ws.close()
+        except Exception:
+            pass
 
 
 async def process_command_queue(ser):
     """
     Process commands from the queue with rate limiting (300ms between commands)
     """
-    global last_command_time, is_processing_queue
+    global next_command_ns, is_processing_queue
     
     while True:
         try:
@@ -93,27 +272,29 @@ async def process_command_queue(ser):
             command = await command_queue.get()
             
             # Check if we need to wait for rate limiting
-            now = datetime.now().timestamp() * 1000  # Convert to milliseconds
-            time_since_last = now - last_command_time
-            delay_needed = RATE_LIMIT_MS - time_since_last
+            delay_ns = next_command_ns - time.monotonic_ns()
             
-            if delay_needed > 0:
-                print(f'[QUEUE] Rate limiting: waiting {delay_needed:.0f}ms')
-                await asyncio.sleep(delay_needed / 1000)  # Convert back to seconds
+            if delay_ns > 0:
+                log.debug('[QUEUE] Rate limiting: waiting %.0fms', delay_ns / 1_000_000)
+                await asyncio.sleep(delay_ns / 1_000_000_000)
             
             # Send the command
             try:
-                formatted_command = command if command.endswith('\r\n') else command + '\r\n'
-                ser.write(formatted_command.encode('utf-8'))
-                last_command_time = datetime.now().timestamp() * 1000
-                print(f'[SENT] Command sent to serial port: "{command}"')
+                # Nexmosphere commands are plain ASCII
+                buf = command.encode('ascii')
+                if not buf.endswith(_CRLF):
+                    buf += _CRLF
+                # Blocking write runs on a worker thread so the loop keeps serving clients
+                await asyncio.to_thread(ser.write, buf)
+                next_command_ns = time.monotonic_ns() + RATE_LIMIT_NS
+                log.debug('[SENT] Command sent to serial port: "%s"', command)
             except Exception as e:
-                print(f'[ERROR] Failed to send command: "{command}" | Error: {e}')
+                log.error('[ERROR] Failed to send command: "%s" | Error: %s', command, e)
             
             command_queue.task_done()
             
         except Exception as e:
-            print(f'[QUEUE-ERROR] {e}')
+            log.error('[QUEUE-ERROR] %s', e)
             await asyncio.sleep(0.1)
 
 
@@ -124,71 +305,86 @@ def get_available_ports():
         ports = [port.device for port in list_ports.comports()]
         return ports if ports else ['None found']
     except Exception as e:
-        print(f'[WARNING] Could not list ports: {e}')
+        log.warning('[WARNING] Could not list ports: %s', e)
         return ['COM3', 'COM4', 'COM5']  # Default fallback
 
 
+def read_text_file(filename):
+    """Read a whole text file (blocking)"""
+    with open(filename, 'r') as f:
+        return f.read()
+
+
 async def load_and_queue_commands(filename='commands.nex'):
     """Load commands from file and queue them for execution"""
     try:
         if not os.path.exists(filename):
-            print(f'[COMMANDS] No {filename} file found')
+            log.info('[COMMANDS] No %s file found', filename)
             return
         
-        with open(filename, 'r') as f:
-            lines = f.readlines()
+        # Read on a worker thread so slow storage doesn't block the event loop
+        data = await asyncio.to_thread(read_text_file, filename)
         
         queued_count = 0
-        for line in lines:
+        for line in data.splitlines():
             stripped = line.strip()
             
             # Skip comment lines
             if stripped.startswith('#'):
                 continue
             
+            # Commands are sent as ASCII; anything else would fail at the serial port
+            if not stripped.isascii():
+                log.warning('[COMMANDS] Skipping non-ASCII command: "%s"', stripped)
+                continue
+            
             # Empty line = clear screen command
             if not stripped:
-                await command_queue.put('CLEAR')
+                command_queue.put_nowait('CLEAR')  # Unbounded queue, never blocks
                 queued_count += 1
-                print(f'[COMMANDS] Queued command {queued_count}: "CLEAR" (empty line)')
+                log.debug('[COMMANDS] Queued command %d: "CLEAR" (empty line)', queued_count)
             else:
                 # Regular command
-                await command_queue.put(stripped)
+                command_queue.put_nowait(stripped)
                 queued_count += 1
-                print(f'[COMMANDS] Queued command {queued_count}: "{stripped}"')
+                log.debug('[COMMANDS] Queued command %d: "%s"', queued_count, stripped)
         
         if queued_count == 0:
-            print(f'[COMMANDS] No commands found in {filename}')
+            log.info('[COMMANDS] No commands found in %s', filename)
         else:
-            print(f'[COMMANDS] Loaded {queued_count} command(s) from {filename}')
+            log.info('[COMMANDS] Loaded %d command(s) from %s', queued_count, filename)
     
     except Exception as e:
-        print(f'[COMMANDS-ERROR] Failed to load commands: {e}')
+        log.error('[COMMANDS-ERROR] Failed to load commands: %s', e)
 
 
 async def websocket_handler(request):
     """
     Handle WebSocket connections
     """
-    ws = web.WebSocketResponse()
+    # No permessage-deflate: the shared payload would otherwise be compressed per client
+    ws = web.WebSocketResponse(compress=False)
     await ws.prepare(request)
     
     client_id = f'{request.remote}:{request.url.port if request.url.port else "unknown"}'
-    connected_clients.add(ws)
-    print(f'[WEBSOCKET] Client connected: {client_id} (Total: {len(connected_clients)})')
+    outbox = ClientOutbox(CLIENT_QUEUE_SIZE)
+    add_client(ws, outbox)
+    sender_task = asyncio.create_task(client_sender(ws, outbox))
+    log.info('[WEBSOCKET] Client connected: %s (Total: %d)', client_id, len(connected_clients))
     
     try:
         async for msg in ws:
             if msg.type == web.WSMsgType.TEXT:
-                print(f'[WEBSOCKET-MESSAGE] From {client_id}: {msg.data}')
+                log.debug('[WEBSOCKET-MESSAGE] From %s: %s', client_id, msg.data)
             elif msg.type == web.WSMsgType.ERROR:
-                print(f'[WEBSOCKET-ERROR] {ws.exception()}')
+                log.error('[WEBSOCKET-ERROR] %s', ws.exception())
     
     except Exception as e:
-        print(f'[WEBSOCKET-ERROR] {e}')
+        log.error('[WEBSOCKET-ERROR] %s', e)
     finally:
-        connected_clients.discard(ws)
-        print(f'[WEBSOCKET] Client disconnected: {client_id} (Total: {len(connected_clients)})')
+        remove_client(ws)
+        sender_task.cancel()
+        log.info('[WEBSOCKET] Client disconnected: %s (Total: %d)', client_id, len(connected_clients))
     
     return ws
 
@@ -204,12 +400,16 @@ async def send_command_handler(request):
         if not command:
             return web.json_response({'error': 'Command is required'}, status=400)
         
-        print(f'[INCOMING] POST /send-command received: "{command}"')
+        # Commands are sent as ASCII, the only encoding Nexmosphere controllers use
+        if not command.isascii():
+            return web.json_response({'error': 'Command must be ASCII'}, status=400)
+        
+        log.debug('[INCOMING] POST /send-command received: "%s"', command)
         
         # Add to command queue
         await command_queue.put(command)
         queue_size = command_queue.qsize()
-        print(f'[QUEUE] Command queued: "{command}" | Queue size: {queue_size}')
+        log.debug('[QUEUE] Command queued: "%s" | Queue size: %d', command, queue_size)
         
         # Return success response
         return web.json_response({
@@ -220,7 +420,7 @@ async def send_command_handler(request):
         })
     
     except Exception as e:
-        print(f'[HTTP-ERROR] Error handling /send-command: {e}')
+        log.error('[HTTP-ERROR] Error handling /send-command: %s', e)
         return web.json_response({'error': str(e)}, status=500)
 
 
@@ -246,114 +446,176 @@ async def nextest_handler(request):
     return web.Response(text='nextest/index.html not found', status=404)
 
 
+# Precompiled OSC argument decoders (big-endian 32-bit)
+_I32 = struct.Struct('>i')
+_F32 = struct.Struct('>f')
+
+
+def _decode_osc_int(data, offset, end):
+    if offset + 4 > end:
+        raise ValueError('truncated int32')
+    return _I32.unpack_from(data, offset)[0], offset + 4
+
+
+def _decode_osc_float(data, offset, end):
+    if offset + 4 > end:
+        raise ValueError('truncated float32')
+    return round(_F32.unpack_from(data, offset)[0], 4), offset + 4
+
+
+def _decode_osc_string(data, offset, end):
+    str_end = data.index(b'\x00', offset, end)
+    return data[offset:str_end].decode('utf-8'), (str_end + 4) & ~3
+
+
+# OSC type tag -> decoder returning (value, next offset)
+_OSC_DECODERS = {
+    'i': _decode_osc_int,
+    'f': _decode_osc_float,
+    's': _decode_osc_string,
+}
+
+
+def parse_osc_bundle(data):
+    """
+    Parse OSC bundle/message format used by TUIO
+    Returns list of parsed TUIO messages
+    """
+    messages = []
+    try:
+        # Check for OSC bundle header "#bundle"
+        if data.startswith(b'#bundle'):
+            # Skip bundle header (8 bytes) + timetag (8 bytes)
+            offset = 16
+            data_len = len(data)
+            while offset + 4 <= data_len:
+                # Read message size (4 bytes, big-endian)
+                msg_size = _I32.unpack_from(data, offset)[0]
+                offset += 4
+                if msg_size < 0 or offset + msg_size > data_len:
+                    break
+                # Parse in place within the bundle buffer rather than copying each element out
+                parsed = parse_osc_message(data, offset, offset + msg_size)
+                if parsed:
+                    messages.append(parsed)
+                offset += msg_size
+        else:
+            # Single OSC message
+            parsed = parse_osc_message(data)
+            if parsed:
+                messages.append(parsed)
+    except Exception as e:
+        log.error('[TUIO-PARSE] Error: %s', e)
+    
+    return messages
+
+
+def parse_osc_message(data, start=0, end=None):
+    """
+    Parse a single OSC message occupying data[start:end]
+    Returns dict with address and arguments
+    """
+    if end is None:
+        end = len(data)
+    
+    # Find null terminator for address
+    null_idx = data.find(b'\x00', start, end)
+    if null_idx < 0:
+        return None
+    address = data[start:null_idx].decode('utf-8', errors='ignore')
+    
+    # Align to 4 bytes (bundle elements are 4-byte sized, so start is always aligned)
+    offset = (null_idx + 4) & ~3
+    
+    # Find type tag string (starts with ',')
+    if offset >= end or data[offset] != 0x2C:
+        return None
+    type_end = data.find(b'\x00', offset, end)
+    if type_end < 0:
+        return None
+    type_tags = data[offset+1:type_end].decode('ascii', errors='ignore')
+    offset = (type_end + 4) & ~3
+    
+    # Parse arguments based on type tags
+    args = []
+    decoders = _OSC_DECODERS
+    for tag in type_tags:
+        decode = decoders.get(tag)
+        if decode is None:
+            continue
+        try:
+            val, offset = decode(data, offset, end)
+        except ValueError:
+            break  # Truncated message, keep what we have
+        args.append(val)
+    
+    return {'address': address, 'args': args}
+
+
+def is_tuio_frame_end(msg):
+    """True if the message closes a TUIO frame"""
+    return msg['address'] == '/tuio2/alv' or msg['args'][:1] == ['fseq']
+
+
 class TUIOProtocol(asyncio.DatagramProtocol):
     """
     UDP Protocol handler for TUIO messages (OSC format)
     """
-    def __init__(self):
+    def __init__(self, forward=None):
         self.transport = None
+        self.forward = forward or self.feed  # Where parsed messages go (another loop's feed for shards)
+        self.pending = []          # Messages of the current (not yet terminated) TUIO frame
+        self.flush_handle = None   # Fallback timer for sources that never end their frames
     
     def connection_made(self, transport):
         self.transport = transport
-        print(f'[TUIO] UDP listener ready on port {TUIO_PORT}')
+        log.info('[TUIO] UDP listener ready on port %d', TUIO_PORT)
     
     def datagram_received(self, data, addr):
         """
         Parse incoming TUIO/OSC data and broadcast to WebSocket clients
         """
         try:
-            messages = self.parse_osc_bundle(data)
+            messages = parse_osc_bundle(data)
             if messages:
-                asyncio.create_task(self.broadcast_tuio(messages))
+                self.forward(messages)
         except Exception as e:
-            print(f'[TUIO-ERROR] Failed to parse: {e}')
+            log.error('[TUIO-ERROR] Failed to parse: %s', e)
     
-    def parse_osc_bundle(self, data):
+    def feed(self, messages):
         """
-        Parse OSC bundle/message format used by TUIO
-        Returns list of parsed TUIO messages
+        Add parsed messages to the current frame (must run on the main event loop)
         """
-        messages = []
-        try:
-            # Check for OSC bundle header "#bundle"
-            if data.startswith(b'#bundle'):
-                # Skip bundle header (8 bytes) + timetag (8 bytes)
-                offset = 16
-                while offset < len(data):
-                    if offset + 4 > len(data):
-                        break
-                    # Read message size (4 bytes, big-endian)
-                    msg_size = int.from_bytes(data[offset:offset+4], 'big')
-                    offset += 4
-                    if offset + msg_size > len(data):
-                        break
-                    msg_data = data[offset:offset+msg_size]
-                    parsed = self.parse_osc_message(msg_data)
-                    if parsed:
-                        messages.append(parsed)
-                    offset += msg_size
-            else:
-                # Single OSC message
-                parsed = self.parse_osc_message(data)
-                if parsed:
-                    messages.append(parsed)
-        except Exception as e:
-            print(f'[TUIO-PARSE] Error: {e}')
+        self.pending.extend(messages)
         
-        return messages
+        # A frame ends with fseq (TUIO 1.x) or /tuio2/alv (TUIO 2.0); send the
+        # whole frame as one WebSocket message
+        if any(is_tuio_frame_end(msg) for msg in messages):
+            self.flush()
+        elif self.flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self.flush_handle = loop.call_later(TUIO_FLUSH_MS / 1000, self.flush)
     
-    def parse_osc_message(self, data):
+    def flush(self):
         """
-        Parse a single OSC message
-        Returns dict with address and arguments
+        Broadcast all pending TUIO messages as a single frame
         """
-        try:
-            # Find null terminator for address
-            null_idx = data.index(b'\x00')
-            address = data[:null_idx].decode('utf-8')
-            
-            # Align to 4 bytes
-            offset = (null_idx + 4) & ~3
-            
-            # Find type tag string (starts with ',')
-            if offset < len(data) and data[offset:offset+1] == b',':
-                type_end = data.index(b'\x00', offset)
-                type_tags = data[offset+1:type_end].decode('utf-8')
-                offset = (type_end + 4) & ~3
-                
-                # Parse arguments based on type tags
-                args = []
-                for tag in type_tags:
-                    if tag == 'i':  # int32
-                        if offset + 4 <= len(data):
-                            val = int.from_bytes(data[offset:offset+4], 'big', signed=True)
-                            args.append(val)
-                            offset += 4
-                    elif tag == 'f':  # float32
-                        if offset + 4 <= len(data):
-                            import struct
-                            val = struct.unpack('>f', data[offset:offset+4])[0]
-                            args.append(round(val, 4))
-                            offset += 4
-                    elif tag == 's':  # string
-                        str_end = data.index(b'\x00', offset)
-                        val = data[offset:str_end].decode('utf-8')
-                        args.append(val)
-                        offset = (str_end + 4) & ~3
-                
-                return {'address': address, 'args': args}
-        except Exception as e:
-            pass
-        return None
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        
+        if self.pending:
+            messages, self.pending = self.pending, []
+            self.broadcast_tuio(messages)
     
-    async def broadcast_tuio(self, messages):
+    def broadcast_tuio(self, messages):
         """
         Broadcast parsed TUIO messages to WebSocket clients
         """
         if not connected_clients:
             return
         
-        timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
+        timestamp = _now_ts()
         
         # Process TUIO messages into a cleaner format
         tuio_data = {
@@ -363,37 +625,99 @@ class TUIOProtocol(asyncio.DatagramProtocol):
         }
         
         # Log cursor/object data (filter out alive/fseq messages for cleaner logs)
-        for msg in messages:
-            addr = msg.get('address', '')
-            if '/tuio/2Dcur' in addr or '/tuio/2Dobj' in addr:
-                args = msg.get('args', [])
-                if args and args[0] == 'set':
-                    print(f'[TUIO-IN] {timestamp} - {addr} {args}')
+        if log.isEnabledFor(logging.DEBUG):
+            for msg in messages:
+                addr = msg.get('address', '')
+                if '/tuio/2Dcur' in addr or '/tuio/2Dobj' in addr:
+                    args = msg.get('args', [])
+                    if args and args[0] == 'set':
+                        log.debug('[TUIO-IN] %s - %s %s', timestamp, addr, args)
         
-        disconnected = set()
-        for client in connected_clients:
-            try:
-                await client.send_json(tuio_data)
-            except Exception as e:
-                disconnected.add(client)
-        
-        connected_clients.difference_update(disconnected)
+        broadcast(tuio_data, droppable=True)
+
+
+def open_tuio_socket():
+    """
+    Create a UDP socket bound to the TUIO port that other shards can also bind
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((TUIO_HOST, TUIO_PORT))
+    return sock
+
+
+def run_tuio_shard(loop, sock, forward):
+    """
+    Run a TUIO listener on its own event loop until the loop is stopped (thread target)
+    """
+    asyncio.set_event_loop(loop)
+    try:
+        transport, _ = loop.run_until_complete(loop.create_datagram_endpoint(
+            lambda: TUIOProtocol(forward),
+            sock=sock
+        ))
+    except Exception as e:
+        log.error('[TUIO-ERROR] Shard failed to start: %s', e)
+        sock.close()
+        loop.close()
+        return
+    
+    try:
+        loop.run_forever()
+    finally:
+        transport.close()
+        loop.run_until_complete(asyncio.sleep(0))  # Let the transport finish closing
+        loop.close()
+
+
+def start_tuio_shards(count, forward):
+    """
+    Start extra TUIO listener threads on the shared port
+    Returns list of (loop, thread) pairs for stop_tuio_shards()
+    """
+    shards = []
+    for i in range(1, count):
+        try:
+            sock = open_tuio_socket()
+        except OSError as e:
+            log.error('[TUIO-ERROR] Could not open shard socket: %s', e)
+            break
+        loop = event_loop_factory()
+        thread = threading.Thread(
+            target=run_tuio_shard,
+            args=(loop, sock, forward),
+            name=f'tuio-shard-{i}',
+            daemon=True
+        )
+        thread.start()
+        shards.append((loop, thread))
+    return shards
+
+
+def stop_tuio_shards(shards):
+    """
+    Stop shard loops and wait for their threads to close their sockets
+    """
+    for loop, thread in shards:
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(loop.stop)
+    for loop, thread in shards:
+        thread.join(timeout=1)
 
 
 async def main():
     """
     Main function - run serial reader and HTTP/WebSocket server
     """
-    print(f'[STARTUP] Serial Monitor with WebSocket + TUIO')
-    print(f'[STARTUP] Serial Port: {SERIAL_PORT}')
-    print(f'[STARTUP] Baud Rate: {BAUD_RATE}')
-    print(f'[STARTUP] Rate Limit: {RATE_LIMIT_MS}ms between commands')
-    print(f'[STARTUP] TUIO UDP: {TUIO_HOST}:{TUIO_PORT}')
-    print(f'[STARTUP] HTTP/WebSocket Server: http://{WEBSOCKET_HOST}:{WEBSOCKET_PORT}')
-    print(f'[STARTUP] WebSocket: ws://{WEBSOCKET_HOST}:{WEBSOCKET_PORT}/ws')
-    print(f'[STARTUP] Test Client: http://{WEBSOCKET_HOST}:{WEBSOCKET_PORT}/nextest')
-    print(f'[STARTUP] Available ports: {get_available_ports()}')
-    print()
+    log.info('[STARTUP] Serial Monitor with WebSocket + TUIO')
+    log.info('[STARTUP] Serial Port: %s', SERIAL_PORT)
+    log.info('[STARTUP] Baud Rate: %d', BAUD_RATE)
+    log.info('[STARTUP] Rate Limit: %dms between commands', RATE_LIMIT_MS)
+    log.info('[STARTUP] TUIO UDP: %s:%d', TUIO_HOST, TUIO_PORT)
+    log.info('[STARTUP] HTTP/WebSocket Server: http://%s:%d', WEBSOCKET_HOST, WEBSOCKET_PORT)
+    log.info('[STARTUP] WebSocket: ws://%s:%d/ws', WEBSOCKET_HOST, WEBSOCKET_PORT)
+    log.info('[STARTUP] Test Client: http://%s:%d/nextest', WEBSOCKET_HOST, WEBSOCKET_PORT)
+    log.info('[STARTUP] Available ports: %s', get_available_ports())
     
     # Create aiohttp app
     app = web.Application()
@@ -428,14 +752,15 @@ async def main():
     site = web.TCPSite(runner, WEBSOCKET_HOST, WEBSOCKET_PORT)
     await site.start()
     
-    print(f'[HTTP] Server started on http://{WEBSOCKET_HOST}:{WEBSOCKET_PORT}')
+    log.info('[HTTP] Server started on http://%s:%d', WEBSOCKET_HOST, WEBSOCKET_PORT)
     
     # Open serial port for command processing
     try:
-        ser = serial.Serial(SERIAL_PORT, BAUD_RATE, timeout=1)
-        print(f'[SERIAL] Port opened for command processing')
+        # No read timeout: the reader thread blocks in readline() until a line arrives
+        ser = serial.Serial(SERIAL_PORT, BAUD_RATE, timeout=None)
+        log.info('[SERIAL] Port opened for command processing')
     except Exception as e:
-        print(f'[ERROR] Failed to open serial port: {e}')
+        log.error('[ERROR] Failed to open serial port: %s', e)
         await runner.cleanup()
         return
     
@@ -444,11 +769,26 @@ async def main():
     
     # Start TUIO UDP listener
     loop = asyncio.get_event_loop()
-    tuio_transport, tuio_protocol = await loop.create_datagram_endpoint(
-        lambda: TUIOProtocol(),
-        local_addr=(TUIO_HOST, TUIO_PORT)
-    )
-    print(f'[TUIO] Listening for TUIO on UDP port {TUIO_PORT}')
+    shards = TUIO_SHARDS
+    if shards > 1 and not (sys.platform.startswith('linux') and hasattr(socket, 'SO_REUSEPORT')):
+        log.warning('[TUIO] SO_REUSEPORT load balancing needs Linux, using a single socket')
+        shards = 1
+    
+    tuio_shards = []
+    if shards > 1:
+        tuio_transport, tuio_protocol = await loop.create_datagram_endpoint(
+            lambda: TUIOProtocol(),
+            sock=open_tuio_socket()
+        )
+        # Extra shards parse on their own threads and hand messages to the main protocol
+        forward = lambda messages: loop.call_soon_threadsafe(tuio_protocol.feed, messages)
+        tuio_shards = start_tuio_shards(shards, forward)
+    else:
+        tuio_transport, tuio_protocol = await loop.create_datagram_endpoint(
+            lambda: TUIOProtocol(),
+            local_addr=(TUIO_HOST, TUIO_PORT)
+        )
+    log.info('[TUIO] Listening for TUIO on UDP port %d', TUIO_PORT)
     
     # Create tasks
     serial_reader_task = asyncio.create_task(serial_reader(ser))
@@ -457,19 +797,70 @@ async def main():
     # Keep running
     try:
         await asyncio.gather(serial_reader_task, command_processor_task)
-    except KeyboardInterrupt:
-        print('\n[SHUTDOWN] Shutting down...')
+    finally:
+        # Runs on Ctrl+C too (asyncio.run cancels main)
+        stop_tuio_shards(tuio_shards)
         tuio_transport.close()
         await runner.cleanup()
+        serial_stop.set()  # Before close, so the reader thread exits instead of reporting errors
         ser.close()
 
 
+def setup_logging():
+    """
+    Route log records through a queue so the event loop never blocks on console I/O
+    Returns the started QueueListener (stop it on shutdown to flush)
+    """
+    log_queue = queue.SimpleQueue()
+    log.addHandler(QueueHandler(log_queue))
+    log.setLevel(LOG_LEVEL)
+    log.propagate = False
+    
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter('%(message)s'))
+    listener = QueueListener(log_queue, console)
+    listener.start()
+    return listener
+
+
+def load_fast_event_loop():
+    """
+    Import uvloop (or winloop on Windows) when installed
+    Returns the module, or None to use the default asyncio loop
+    """
+    name = 'winloop' if sys.platform == 'win32' else 'uvloop'
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
 if __name__ == '__main__':
-    # Allow passing serial port as command line argument
-    if len(sys.argv) > 1:
-        SERIAL_PORT = sys.argv[1]
+    # Allow passing serial port as command line argument, plus --debug for per-message traces
+    args = sys.argv[1:]
+    env_level = logging.getLevelName(os.environ.get('NEX_LOG_LEVEL', '').upper())
+    if isinstance(env_level, int):
+        LOG_LEVEL = env_level
+    if '--debug' in args:
+        args.remove('--debug')
+        LOG_LEVEL = logging.DEBUG
+    if args:
+        SERIAL_PORT = args[0]
     
+    log_listener = setup_logging()
+    fast_loop = load_fast_event_loop()
+    if fast_loop is not None:
+        event_loop_factory = fast_loop.new_event_loop
+    log.info('[STARTUP] Event loop: %s', fast_loop.__name__ if fast_loop else 'asyncio (default)')
     try:
-        asyncio.run(main())
+        if sys.version_info >= (3, 12):
+            asyncio.run(main(), loop_factory=event_loop_factory)
+        else:
+            # loop_factory needs Python 3.12; install() is not deprecated before that
+            if fast_loop is not None:
+                fast_loop.install()
+            asyncio.run(main())
     except KeyboardInterrupt:
-        print('\n[SHUTDOWN] Shutting down...')
+        log.info('[SHUTDOWN] Shutting down...')
+    finally:
+        log_listener.stop()